@@ -1,4 +1,4 @@
-#!/usr/bin/python
+#!/usr/bin/env python3
 
 import os
 import struct
@@ -28,28 +28,22 @@ class Classfile:
         self.classfile = classfile
         if not classfile.endswith(".class"):
             raise Exception("File %s is not a java classfile" % classfile)
+        self.basename = os.path.basename(classfile)
+        # Trim off ".class" (6 characters) from the basename to get name of class
+        self.classname = self.basename[:-6]
         # Determine the name-with-package from the folder layout
-        self.classname = Classfile.__determine_classname(self.classfile)
         self.name = Classfile.__determine_qualified_name(self.classfile, self.classname)
         # Parse the classfile
         with open(classfile, "rb") as f:
             self.__parse(f)
 
-    @staticmethod
-    def __determine_classname(path):
-        # Trim off ".class" from the basename to get name of class
-        filename = os.path.basename(path)
-        assert filename.endswith(".class")
-        classname = filename[:-len(".class")]
-        return classname
-
     @staticmethod
     def __determine_qualified_name(path, classname):
         # We're looking for a folder named "classes" or "test-classes"
         # See: https://docs.oracle.com/javase/tutorial/java/package/managingfiles.html
         components = Classfile.__splitall(path)[:-1]
         package = None
-        for x in xrange(len(components)):
+        for x in range(len(components)):
             if components[x] in ("classes", "test-classes"):
                 package = ".".join(components[x+1:])
                 break
@@ -48,7 +48,7 @@ import logging
 import pprint
 import json
 
-import mavenproject, packager
+from . import mavenproject, packager
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +122,7 @@ run java -version
         run_path = os.path.join(self.output_dir, self.__RUN_SCRIPT_NAME)
         with open(run_path, "wt") as out:
             out.write(self._generate_run_script_contents())
-        os.chmod(run_path, 0755)
+        os.chmod(run_path, 0o755)
 
         # Write the parameterized isolate file
         files = self.packager.get_relative_output_paths()
@@ -150,7 +150,7 @@ run java -version
                     "POM" : rel_pom,
                     "TESTCLASS" : test.name,
                 }
-                for k,v in extra_args.iteritems():
+                for k,v in extra_args.items():
                     args += ["--extra-variable", "%s=%s" % (k,v)]
                 gen = {
                     "version" : 1,
@@ -1,14 +1,20 @@
 import os
 import logging
 import fnmatch
+import itertools
+import multiprocessing
 import sys
 import re
 
-import classfile
+from . import classfile
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default Surefire include pattern (Test*, *Test, *TestCase) for classfile names.
+# Nested classes, which have a "$" in the name, are not matched.
+_SUREFIRE_RE = re.compile(r"^(?!.*\$)(?:Test.*|.*Test|.*TestCase)\.class$")
+
 class Module:
     """Struct-like class for holding information about a Maven module.
 
@@ -16,6 +22,10 @@ class Module:
     These are only a loose approximation of an actual Maven multi-module project,
     since the hierarchy is based on the folder structure rather than parent poms."""
 
+    # Large projects have thousands of modules, skip the per-instance __dict__
+    __slots__ = ("root", "root_module", "pom", "test_classes", "source_artifacts",
+                 "test_artifacts", "name", "submodules")
+
     def __init__(self, root):
         self.root = root
         self.root_module = None
@@ -63,8 +73,9 @@ class MavenProject:
         self.included_modules = set() # Modules that match the include_modules filter
         self.excluded_modules = exclude_modules
         self.__include_modules = include_modules
-        # Default filters to find test classes
-        self.__filters = [PotentialTestClassNameFilter(), NoAbstractClassFilter()]
+        # Default filters to find test classes.
+        # The Surefire name pattern is checked while finding classfiles, before parsing.
+        self.__filters = [NoAbstractClassFilter()]
         # Additional user-specified include and exclude patterns
         # Prepend because these are likely more selective than the default filters
         if include_patterns is not None:
@@ -126,13 +137,11 @@ class MavenProject:
 
         # If include_modules was specified, filter the found module list and check for missing modules
         # Filter to just the specified modules
-        included = [m for m in self.modules if m.name in self.__include_modules]
-        # Mismatch in length means we're missing some
-        if len(included) != len(self.__include_modules):
-            for m in included:
-                self.__include_modules.remove(m.name)
-            assert len(self.__include_modules) > 0
-            raise ModuleNotFoundException("Could not find specified modules: " + " ".join(self.__include_modules))
+        requested = set(self.__include_modules)
+        included = [m for m in self.modules if m.name in requested]
+        missing = requested - set(m.name for m in included)
+        if missing:
+            raise ModuleNotFoundException("Could not find specified modules: " + " ".join(sorted(missing)))
         # Add modules to member set, including submodules
         for m in included:
             self._include_module_tree(m)
@@ -142,18 +151,96 @@ class MavenProject:
         for submodule in module.submodules:
             self._include_module_tree(submodule)
 
-    def _find_all_modules(self):
-        # Modules are directories that have a pom.xml and a target dir
-        for root, dirs, files in os.walk(self.project_root):
-            if "pom.xml" in files and "target" in dirs:
-                self.modules.append(Module(os.path.normpath(root)))
+    # Below this many classfiles, parsing serially is cheaper than starting a process pool
+    __PARALLEL_PARSE_THRESHOLD = 512
+
+    # Directories that can never contain a module
+    __PRUNED_DIRS = frozenset(["target", "src", ".git"])
+
+    # Jars in a target directory that hold test classes
+    __TEST_JAR_SUFFIXES = ("-test-sources.jar", "-tests.jar")
+    # Other jars in a target directory that are not needed to run tests
+    __EXCLUDED_JAR_SUFFIXES = ("-sources.jar", "-javadoc.jar")
+
+    def _scan(self):
+        """Find the modules, directories that have a pom.xml and a target dir.
+
+        This is a single scandir pass over the project. When a module is found, its
+        target dir is read right away for artifacts and, if the module can be
+        included, for class files that could be tests. Returns dicts of the
+        potential test class paths and test jars of each module."""
+        include = None
+        if self.__include_modules is not None:
+            include = set(self.__include_modules)
+        exclude = set(self.excluded_modules or [])
+        class_paths = {}
+        test_jars = {}
+        # Depth-first, tracking whether the enclosing modules are included and excluded.
+        # Submodules follow their parents, same as _include_module_tree and _exclude_module_tree.
+        dirs = [(self.project_root, include is None, False)]
+        # Local aliases, these are looked up for every directory entry
+        scandir = os.scandir
+        pruned = MavenProject.__PRUNED_DIRS
+        while dirs:
+            root, included, excluded = dirs.pop()
+            has_pom = False
+            target = None
+            subdirs = []
+            with scandir(root) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name == "pom.xml":
+                        has_pom = entry.is_file()
+                    elif name == "target" and entry.is_dir():
+                        target = entry.path
+                    if name not in pruned and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+            if has_pom and target is not None:
+                module = Module(os.path.normpath(root))
+                self.modules.append(module)
+                included = included or module.name in include
+                excluded = excluded or (included and module.name in exclude)
+                class_paths[module], test_jars[module] = \
+                        self.__scan_target(module, target, included and not excluded)
+            dirs += [(d, included, excluded) for d in subdirs]
+        return class_paths, test_jars
+
+    @staticmethod
+    def __scan_target(module, target_root, find_classes):
+        """Read a module's target dir, adding its jars to source_artifacts.
+        Returns the paths of the class files that could be tests (only if find_classes
+        is set) and the paths of the test jars."""
+        class_dirs = []
+        class_paths = []
+        test_jars = []
+        with os.scandir(target_root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if find_classes:
+                        class_dirs.append(entry.path)
+                    continue
+                # Follows symlinks, like os.path.isfile
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                if name.endswith(MavenProject.__TEST_JAR_SUFFIXES):
+                    test_jars.append(entry.path)
+                elif name.endswith(".jar") and not name.endswith(MavenProject.__EXCLUDED_JAR_SUFFIXES):
+                    module.source_artifacts.append(entry.path)
+                elif find_classes and _SUREFIRE_RE.match(name) is not None:
+                    class_paths.append(entry.path)
+        if class_dirs:
+            logger.debug("Traversing module %s", module.root)
+            class_paths += MavenProject.__find_classfiles(class_dirs)
+        return class_paths, test_jars
 
     def _walk(self):
         """Walk the project directory to enumerate the modules, test classes,
         and project artifacts within a MavenProject."""
 
-        # Find the modules first, directories that have a pom.xml and a target dir
-        self._find_all_modules()
+        # Find the modules first, directories that have a pom.xml and a target dir.
+        # Their artifacts and potential test classes are found in the same pass.
+        class_paths, test_jars = self._scan()
 
         if len(self.modules) == 0:
             logger.error("No modules with target directories found. Did you forget to build the project?")
@@ -164,52 +251,55 @@ class MavenProject:
         self._filter_included_modules()
         self._filter_excluded_modules()
 
-        # For each included module, look for test classes within target dir
+        # Do not need test jars from a module if we're not running its tests
         for module in self.included_modules:
-            logger.debug("Traversing module %s", module.root)
-            for root, dirs, files in os.walk(os.path.join(module.root, "target")):
-                abs_files = [os.path.join(root, f) for f in files]
-                # Make classfile objects for everything that's a valid class
-                classfiles = self.__get_classfiles(abs_files)
-                # Apply classfile filters
-                for fil in self.__filters:
-                    classfiles = [c for c in classfiles if fil.accept(c)]
-                # Set module's classes to the filtered classfiles
-                module.test_classes += classfiles
-
-        # For each module, look for test-sources jars
-        # These will later be extracted
-        for module in self.modules:
-            target_root = os.path.join(module.root, "target")
-            for entry in os.listdir(target_root):
-                abs_path = os.path.join(target_root, entry)
-                if os.path.isfile(abs_path):
-                    if entry.endswith("-test-sources.jar") or entry.endswith("-tests.jar"):
-                        # Do not need test jars from a module if we're not running its tests
-                        if module in self.included_modules:
-                            module.test_artifacts.append(abs_path)
-                    elif entry.endswith(".jar") and not entry.endswith("-sources.jar") and not entry.endswith("-javadoc.jar"):
-                        module.source_artifacts.append(abs_path)
-
-        num_classes = reduce(lambda x,y: x+y,\
-                             [0] + [len(m.test_classes) for m in self.included_modules])
+            module.test_artifacts += test_jars[module]
+
+        # Make classfile objects for all included modules at once, so they can be parsed in parallel
+        module_paths = [(m, class_paths[m]) for m in self.included_modules]
+        all_paths = [p for _, paths in module_paths for p in paths]
+        parsed = iter(self.__get_classfiles(all_paths))
+        filters = self.__filters
+        for module, paths in module_paths:
+            classfiles = itertools.islice(parsed, len(paths))
+            # Apply all the classfile filters in a single pass, set module's classes to the
+            # classfiles that pass. Filters are ordered most selective first so all() stops early.
+            module.test_classes += [c for c in classfiles if all(f.accept(c) for f in filters)]
+
+        num_classes = sum(len(m.test_classes) for m in self.included_modules)
         logging.info("Found %s included modules out of %s total modules with %s test classes within project %s",\
                      len(self.included_modules), len(self.modules), num_classes, self.project_root)
 
     @staticmethod
-    def __get_classfiles(files):
-        classfiles = []
-        for f in files:
-            # Must be a file
-            if not os.path.isfile(f):
-                continue
-            name = os.path.basename(f)
-            # Only class files
-            if not name.endswith(".class"):
-                continue
-            clazz = classfile.Classfile(f)
-            classfiles.append(clazz)
-        return classfiles
+    def __find_classfiles(dirs):
+        """Return the paths of the class files under dirs whose names
+        could be test classes."""
+        paths = []
+        # Local aliases, these are looked up for every file under target
+        scandir = os.scandir
+        match = _SUREFIRE_RE.match
+        add_dir = dirs.append
+        add_path = paths.append
+        while dirs:
+            with scandir(dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        add_dir(entry.path)
+                    # Only class files matching the default Surefire pattern. This is
+                    # checked here rather than with a filter, so non-test classes are
+                    # never parsed. scandir already knows the file type, no need to stat.
+                    elif match(entry.name) is not None and entry.is_file():
+                        add_path(entry.path)
+        return paths
+
+    @staticmethod
+    def __get_classfiles(paths):
+        """Make Classfile objects for the provided paths, preserving order.
+        Large sets of classfiles are parsed in a process pool."""
+        if len(paths) <= MavenProject.__PARALLEL_PARSE_THRESHOLD:
+            return [classfile.Classfile(p) for p in paths]
+        with multiprocessing.Pool(os.cpu_count()) as pool:
+            return pool.map(classfile.Classfile, paths, chunksize=256)
 
 
 class ClassfileFilter:
@@ -221,20 +311,7 @@ class ClassfileFilter:
 class PotentialTestClassNameFilter(ClassfileFilter):
     @staticmethod
     def accept(clazz):
-        f = os.path.basename(clazz.classfile)
-        # No nested classes
-        if "$" in f:
-            return False
-        # Must end in ".class". This is checked earlier, but be paranoid.
-        if not f.endswith(".class"):
-            return False
-        # Match against default Surefire pattern
-        name = f[:-len(".class")]
-        if not name.startswith("Test") and \
-        not name.endswith("Test") and \
-        not name.endswith("TestCase"):
-            return False
-        return True
+        return _SUREFIRE_RE.match(clazz.basename) is not None
 
 
 class NoAbstractClassFilter(ClassfileFilter):
@@ -245,19 +322,17 @@ class NoAbstractClassFilter(ClassfileFilter):
 class IncludePatternsFilter(ClassfileFilter):
     def __init__(self, patterns = None):
         self.patterns = []
-        self.__reobjs = []
-        if patterns is not None:
+        self.__reobj = None
+        if patterns:
             self.patterns = patterns
-            regexes = [fnmatch.translate(p) for p in patterns]
-            self.__reobjs = [re.compile(r) for r in regexes]
+            # Combine the patterns into a single alternation, so each class is matched once
+            regexes = ["(?:%s)" % fnmatch.translate(p) for p in patterns]
+            self.__reobj = re.compile("|".join(regexes))
 
     def accept(self, clazz):
-        matched = False
-        for reobj in self.__reobjs:
-            if reobj.match(clazz.classname) is not None:
-                matched = True
-                break
-        return matched
+        if self.__reobj is None:
+            return False
+        return self.__reobj.match(clazz.classname) is not None
 
 class ExcludePatternsFilter(IncludePatternsFilter):
     def accept(self, clazz):
@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
 """Merges multiple JUnit XML test results into a single file.
 
@@ -98,7 +98,7 @@ def merge_xunit(in_files, out_file, ignore_flaky=False, quiet=False):
 
   # Filter out the failures of flaky tests
   if ignore_flaky:
-    for name, tests in name2tests.iteritems():
+    for name, tests in name2tests.items():
       # Failed: all failed. This also works for skipped tests, since they'll always skip.
       # Flaky: one pass and one or more failures
       # Succeeded: all passed
@@ -11,7 +11,7 @@ import shlex, subprocess
 import shutil
 import tempfile
 
-import util
+from . import util
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,7 +47,7 @@ class Manifest:
         self.extra_deps_checksum = extra_deps_checksum
 
     def write(self, output_file):
-        with open(output_file, "wt") as o:
+        with open(output_file, "wb") as o:
             pickle.dump(self, o)
 
     def __eq__(self, other):
@@ -75,7 +75,7 @@ class Manifest:
         logger.debug("Reading manifest at %s", input_file)
         if not os.path.isfile(input_file):
             return None
-        with open(input_file, "r") as o:
+        with open(input_file, "rb") as o:
             return pickle.load(o)
 
     @staticmethod
@@ -140,7 +140,7 @@ class CacheManager:
 
     @staticmethod
     def print_manifests(manifests):
-        print "\n".join([CacheManager._pretty_str(m) for m in manifests])
+        print("\n".join([CacheManager._pretty_str(m) for m in manifests]))
 
     @staticmethod
     def _pretty_str(manifest):
@@ -291,7 +291,7 @@ class Packager:
             for g in self.__extra_deps.file_globs:
                 for match in glob.iglob(g):
                     if os.path.isabs(match):
-                        LOG.warn("Skipping absolute match %s", match)
+                        logger.warning("Skipping absolute match %s", match)
                     else:
                         self.__copy(module.root, os.path.join(module.root, match))
             os.chdir(cwd)
@@ -429,7 +429,7 @@ class Packager:
             for line in lines:
                 out.write(line)
                 out.write("\n")
-        os.chmod(outpath, 0755)
+        os.chmod(outpath, 0o755)
         logging.info("Wrote pre-run unpacking script to %s", outpath)
 
     def get_relative_output_paths(self):
@@ -15,7 +15,7 @@ TEST_PROJECT_PATH = os.path.join(TEST_RESOURCES, "MultiModuleTestProject")
 def setUpModule():
     # Build the test project
     cmd = "mvn -q package -DskipTests"
-    print "Building test maven project at %s" % TEST_PROJECT_PATH
+    print("Building test maven project at %s" % TEST_PROJECT_PATH)
     args = shlex.split(cmd)
     p = subprocess.Popen(args, cwd=TEST_PROJECT_PATH)
     p.wait()
@@ -29,7 +29,7 @@ class TestMavenProject(unittest.TestCase):
         for module in project.modules:
             if "module-two" in module.root:
                 # Expect a test-sources.jar and a tests.jar
-                self.assertEquals(2, len(module.test_artifacts))
+                self.assertEqual(2, len(module.test_artifacts))
                 found = [False, False]
                 for artifact in module.test_artifacts:
                     if artifact.endswith("test-sources.jar"):
@@ -49,7 +49,7 @@ class TestMavenProject(unittest.TestCase):
 
         for l in include_lists:
             project = mavenproject.MavenProject(TEST_PROJECT_PATH, l)
-            self.assertEquals(len(l), len(project.included_modules))
+            self.assertEqual(len(l), len(project.included_modules))
             for m in project.included_modules:
                 self.assertTrue(m.name in l,
                            "Found unexpected module %s for include list %s" % (m.name, l))
@@ -60,11 +60,15 @@ class TestMavenProject(unittest.TestCase):
         ]
 
         for l in invalid_lists:
+            requested = list(l)
             try:
                 project = mavenproject.MavenProject(TEST_PROJECT_PATH, l)
                 self.fail("Should have failed to find nonexistent module list " + l)
-            except mavenproject.ModuleNotFoundException:
-                pass
+            except mavenproject.ModuleNotFoundException as e:
+                self.assertTrue("blahmodule" in str(e))
+                self.assertFalse("module-two" in str(e))
+            # The caller's list should not be modified
+            self.assertEqual(requested, l)
 
     def test_IncludeExcludePatterns(self):
         # list of (([includes], [excludes]), [results])
@@ -90,7 +94,7 @@ class TestMavenProject(unittest.TestCase):
         ]
 
         for ((include,exclude), results) in expected:
-            print include, exclude, results
+            print(include, exclude, results)
             project = mavenproject.MavenProject(TEST_PROJECT_PATH, include_patterns=include, exclude_patterns=exclude)
             classes = []
             for module in project.included_modules:
@@ -122,7 +126,7 @@ class TestFilters(unittest.TestCase):
                     self.assertTrue(noabs_filter.accept(clazz), "Path %s is not abstract!" % fullpath)
                 num_files += 1
 
-        print "Filtered %s files" % num_files
+        print("Filtered %s files" % num_files)
 
 class TestPackager(unittest.TestCase):
 
@@ -135,10 +139,10 @@ class TestPackager(unittest.TestCase):
 
     def print_output_dir(self):
         for root, dirs, files in os.walk(self.output_dir):
-            print "Contents of", root
+            print("Contents of", root)
             for f in files:
-                print os.path.join(root, f)
-            print
+                print(os.path.join(root, f))
+            print()
 
     @classmethod
     def tearDownClass(self):
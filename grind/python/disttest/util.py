@@ -25,24 +25,16 @@ def sizeof_fmt(num, suffix='B'):
 def prompt_confirmation(msg):
     """Prompt user for confirmation. Returns True if yes, False if no. Defaults to no."""
     sys.stdout.write("%s (y/N): " % msg)
-    choice = raw_input().lower()
+    choice = input().lower()
     if choice == "y":
         return True
     return False
 
 def prompt_confirm_or_exit(msg):
     if not prompt_confirmation(msg):
-        print "Aborted"
+        print("Aborted")
         sys.exit(1)
 
 def check_output(*args, **kwargs):
-    """Workaround for Python 2.6 not having subprocess.check_output"""
-    if "check_output" in dir(subprocess):
-        return subprocess.check_output(*args, **kwargs)
-
-    p = subprocess.Popen(stdout=subprocess.PIPE, *args, **kwargs)
-    stdout, _ = p.communicate()
-    ret = p.poll()
-    if ret:
-        raise Exception("Command %s failed." % (repr( (args, kwargs) )))
-    return stdout
+    """subprocess.check_output, returning the output as a string rather than bytes"""
+    return subprocess.check_output(*args, universal_newlines=True, **kwargs)
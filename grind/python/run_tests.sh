@@ -5,4 +5,4 @@
 DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd )"
 
 cd $DIR
-python2.7 -m unittest disttest.test.test
+python3 -m unittest disttest.test.test
@@ -1,4 +1,4 @@
-#!/usr/bin/env python2.7
+#!/usr/bin/env python3
 
 import tempfile
 import os
@@ -6,7 +6,7 @@ import os
 java_home = os.environ["JAVA_HOME"]
 
 if java_home is None or len(java_home) == 0:
-  print "JAVA_HOME is not set!"
+  print("JAVA_HOME is not set!")
   sys.exit(1)
 
 out_dir = tempfile.mkdtemp()
@@ -38,10 +38,10 @@ for root, dirs, files in os.walk(java_home):
     if os.path.basename(root) == "bin" and f == "java":
       with open(out_path, "wt") as o:
         o.write(wrapper_java)
-      os.chmod(out_path, 0755)
+      os.chmod(out_path, 0o755)
     else:
       os.symlink(os.path.join(root, f), out_path)
   for d in dirs:
     os.mkdir(os.path.join(out_dir, relroot, d))
 
-print "Created JAVA_HOME facade in", out_dir
+print("Created JAVA_HOME facade in", out_dir)